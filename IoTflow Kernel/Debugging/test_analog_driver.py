@@ -124,7 +124,7 @@ def main():
         ],
     }
 
-    drv = AnalogDriver(i2c, cfg)
+    drv = AnalogDriver(i2c, cfg, verbose=True)
     drv.print_channel_configs()
 
     print("Starting read loop. Press Ctrl+C to stop.")
@@ -45,55 +45,55 @@ cfg = {
   "channels": [
     {
       "name": "Sensor A",
-      "channel_type": "2",
-      "interface_type": "01",
+      "channel_type": 2,
+      "interface_type": 1,
       "channel_number": 0,
       "actions": 0,
-      "measurement_range": "0b10000011",
+      "measurement_range": 0b10000011,
       "adc_hardware_gain": 0.23761904761904762,
       "shunt_resistance": 0.249,
       "adc_offset": 0.0
     },
     {
       "name": "Sensor B",
-      "channel_type": "2",
-      "interface_type": "01",
+      "channel_type": 2,
+      "interface_type": 1,
       "channel_number": 1,
       "actions": 0,
-      "measurement_range": "0b10100001",
+      "measurement_range": 0b10100001,
       "adc_hardware_gain": 0.23761904761904762,
       "shunt_resistance": 0.249,
       "adc_offset": 0.0
     },
     {
       "name": "Sensor C",
-      "channel_type": "2",
-      "interface_type": "01",
+      "channel_type": 2,
+      "interface_type": 1,
       "channel_number": 2,
       "actions": 0,
-      "measurement_range": "0b10000011",
+      "measurement_range": 0b10000011,
       "adc_hardware_gain": 0.23761904761904762,
       "shunt_resistance": 0.249,
       "adc_offset": 0.0
     },
     {
       "name": "Sensor D",
-      "channel_type": "2",
-      "interface_type": "01",
+      "channel_type": 2,
+      "interface_type": 1,
       "channel_number": 3,
       "actions": 0,
-      "measurement_range": "0b10100001",
+      "measurement_range": 0b10100001,
       "adc_hardware_gain": 0.23761904761904762,
       "shunt_resistance": 0.249,
       "adc_offset": 0.0
     },
     {
       "name": "Sensor E",
-      "channel_type": "2",
-      "interface_type": "01",
+      "channel_type": 2,
+      "interface_type": 1,
       "channel_number": 2,
       "actions": 0,
-      "measurement_range": "0b10000011",
+      "measurement_range": 0b10000011,
       "adc_hardware_gain": 0.23761904761904762,
       "shunt_resistance": 0.249,
       "adc_offset": 0.0
@@ -133,7 +133,7 @@ cfg = {
       "0x49"
     ]
   },
-  "pin_config": "0b00001111",
+  "pin_config": 0b00001111,
   "status_update_interval_s": 30
 }
 
@@ -144,7 +144,7 @@ print("Packed size:", len(packed), "bytes")
 
 # # Setup I2C and EEPROM
 i2c = I2C(0, scl=15, sda=16, freq=400000)
-eeprom = EEPROM(i2c, 0x57)
+eeprom = EEPROM(i2c, 0x57, verbose=True)
 # 
 # # Write packed config
 # eeprom.write_bytes(0x002, packed)
@@ -165,6 +165,6 @@ eeprom = EEPROM(i2c, 0x57)
 # print("Restored config:")
 # print(ujson.dumps(restored))
 
-# ERASE FIRST
+# ERASE FIRST (only the length header + packed config region)
 print("Erasing EEPROM...")
-eeprom.erase_all()
+eeprom.erase_range(0, len(packed) + 2)
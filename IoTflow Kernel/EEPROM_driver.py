@@ -45,8 +45,30 @@ Features:
 """
 
 import time
+import binascii
 from machine import I2C
 
+# Printable ASCII for dump_hex, '.' for everything else (indexed by byte value)
+_ASCII_TBL = ''.join([chr(c) if 32 <= c <= 126 else '.' for c in range(256)])
+
+# Last scan result per I2C bus object (native machine.I2C objects cannot
+# carry extra attributes, so the cache lives here)
+_scan_cache = {}
+
+
+def scan_bus(i2c, refresh=False):
+    """
+    Return the list of addresses answering on an I2C bus
+    
+    The bus is only scanned once; later calls reuse the result
+    unless refresh is set.
+    """
+    devices = None if refresh else _scan_cache.get(i2c)
+    if devices is None:
+        devices = i2c.scan()
+        _scan_cache[i2c] = devices
+    return devices
+
 class EEPROM:
     """
     Driver for M24C08-R 8-Kbit I2C EEPROM
@@ -59,8 +81,12 @@ class EEPROM:
     MEMORY_SIZE = 1024  # 1KB total memory
     PAGE_SIZE = 16      # 16-byte pages
     MAX_WRITE_TIME_MS = 10  # Maximum write cycle time in ms (increase for ESP32-S3 stability)
-    
-    def __init__(self, i2c, address=0x57, e2_bit=0):
+    WRITE_SETTLE_MS = 3     # Initial wait before ACK polling (typ. write cycle is ~5 ms)
+    ACK_POLL_US = 500       # Interval between ACK polls once the settle time has elapsed
+    USE_ACK_POLLING = True  # False -> skip polling and sleep the full MAX_WRITE_TIME_MS
+    _ERASE_PAGE = b'\xff' * PAGE_SIZE  # Erased page contents, shared by all erase paths
+
+    def __init__(self, i2c, address=0x57, e2_bit=0, verbose=False):
         """
         Initialize the M24C08-R EEPROM driver
         
@@ -68,10 +94,24 @@ class EEPROM:
             i2c: I2C object (machine.I2C)
             address: Base I2C address (0x57 default, bits A2:A0 can modify this)
             e2_bit: E2 pin state (0 or 1) - affects device select code bit 3
+            verbose: Print progress messages for long operations (erase_all)
         """
         self.i2c = i2c
+        self.verbose = verbose
         self.base_address = address
         self.e2_bit = e2_bit & 1  # Ensure it's 0 or 1
+        # Device select code for each 256-byte block (indexed by A9:A8)
+        base = address & ~0x03  # Example: 0x57 & 0xFC = 0x54
+        self._dev_addrs = tuple(base | a9_a8 for a9_a8 in range(4))
+        # Reused write frame: word-address byte followed by up to one page of data
+        self._tx_buf = bytearray(1 + self.PAGE_SIZE)
+        self._tx_mv = memoryview(self._tx_buf)
+        # Combined write-then-read (repeated START) support, absent on some ports
+        self._has_readfrom_mem = hasattr(i2c, 'readfrom_mem')
+        
+        # RAM write-back cache (see buffer_fill / buffer_flush)
+        self._cache = None                # bytearray mirror of the whole EEPROM once filled
+        self._dirty = bytearray(8)        # one bit per 16-byte page (64 pages)
         
         # Verify EEPROM is responding
         if not self._is_device_present():
@@ -85,42 +125,79 @@ class EEPROM:
         Device select format: 1010 E2 A9 A8 R/W
         """
         # Extract A9 and A8 from memory address
-        a9_a8 = (memory_address >> 8) & 0x03
-        base = self.base_address & ~0x03  # Example: 0x57 & 0xFC = 0x54
-        device_addr = base | a9_a8
-        
-        return device_addr
+        return self._dev_addrs[(memory_address >> 8) & 0x03]
     
     def _is_device_present(self):
-        """Check if the device is present and responding"""
+        """
+        Check if the device is present and responding
+        
+        Uses the bus scan rather than an empty write, which some ports
+        acknowledge even when nothing is attached. A miss in a cached scan
+        triggers one fresh scan before giving up.
+        """
+        device_addr = self._dev_addrs[0]
         try:
-            device_addr = self._get_device_address(0)
-            self.i2c.writeto(device_addr, b'')
-            return True
+            if device_addr in scan_bus(self.i2c):
+                return True
+            return device_addr in scan_bus(self.i2c, refresh=True)
         except OSError:
             return False
     
     def _wait_write_complete(self, memory_address):
         """
         Wait for write cycle to complete using ACK polling
-        
+
         During internal write cycle, the device won't acknowledge.
-        We poll until it responds with ACK.
+        The write can never finish before WRITE_SETTLE_MS, so we sleep
+        first and only then poll (coarsely) until it responds with ACK.
+        With USE_ACK_POLLING disabled the worst-case cycle time is slept instead.
         """
+        if not self.USE_ACK_POLLING:
+            time.sleep_ms(self.MAX_WRITE_TIME_MS)
+            return
+
+        # Local binds avoid attribute lookups on every poll iteration
+        ticks_ms = time.ticks_ms
+        ticks_diff = time.ticks_diff
+        sleep_us = time.sleep_us
+        writeto = self.i2c.writeto
+        poll_us = self.ACK_POLL_US
+
         device_addr = self._get_device_address(memory_address)
-        timeout = time.ticks_ms() + (self.MAX_WRITE_TIME_MS * 3)  # Add more margin for some chips
-        
-        while time.ticks_diff(timeout, time.ticks_ms()) > 0:
+        timeout = time.ticks_add(ticks_ms(), self.MAX_WRITE_TIME_MS * 3)  # Add more margin for some chips
+        time.sleep_ms(self.WRITE_SETTLE_MS)
+
+        while ticks_diff(timeout, ticks_ms()) > 0:
             try:
                 # Try to communicate with device
-                self.i2c.writeto(device_addr, b'')
+                writeto(device_addr, b'')
                 return  # Success - write cycle complete
             except OSError:
                 # Device still busy, continue polling
-                time.sleep_ms(1)
+                sleep_us(poll_us)
         
         raise RuntimeError("Write cycle timeout")
     
+    def _read_block(self, device_addr, addr_byte, length):
+        """
+        Random address read within a single 256-byte block
+
+        Uses one repeated-START transaction when the port supports it,
+        otherwise falls back to a separate address write and read.
+        """
+        if self._has_readfrom_mem:
+            return self.i2c.readfrom_mem(device_addr, addr_byte, length)
+        self.i2c.writeto(device_addr, bytes([addr_byte]))
+        return self.i2c.readfrom(device_addr, length)
+    
+    def _read_block_into(self, device_addr, addr_byte, buf):
+        """_read_block that fills a preallocated buffer instead of returning bytes"""
+        if self._has_readfrom_mem:
+            self.i2c.readfrom_mem_into(device_addr, addr_byte, buf)
+        else:
+            self.i2c.writeto(device_addr, bytes([addr_byte]))
+            self.i2c.readfrom_into(device_addr, buf)
+    
     def _validate_address(self, address, length=1):
         """Validate memory address and length"""
         if address < 0 or address >= self.MEMORY_SIZE:
@@ -140,12 +217,14 @@ class EEPROM:
         """
         self._validate_address(address)
         
+        if self._cache is not None:
+            return self._cache[address]
+        
         device_addr = self._get_device_address(address)
         addr_byte = address & 0xFF  # Lower 8 bits
         
         # Random address read: write address, then read data
-        self.i2c.writeto(device_addr, bytes([addr_byte]))
-        data = self.i2c.readfrom(device_addr, 1)
+        data = self._read_block(device_addr, addr_byte, 1)
         
         return data[0]
     
@@ -161,32 +240,61 @@ class EEPROM:
             bytes: Data read from EEPROM
         """
         self._validate_address(address, length)
+        return self._read_bytes_nocheck(address, length)
+    
+    def _read_bytes_nocheck(self, address, length):
+        """read_bytes without range validation, for internal callers that already checked"""
+        if self._cache is not None:
+            return bytes(self._cache[address:address + length])
         
-        device_addr = self._get_device_address(address)
-        addr_byte = address & 0xFF
+        data = bytearray(length)
+        self._read_into_nocheck(address, data)
+        return bytes(data)
+    
+    def read_into(self, address, buf):
+        """
+        Read len(buf) bytes starting from the specified address into buf
+        
+        Each 256-byte block is fetched with one combined transaction
+        straight into the caller's buffer, so no intermediate bytes
+        objects are created.
+        
+        Args:
+            address: Starting memory address
+            buf: Preallocated bytearray (or writable memoryview) to fill
+        """
+        self._validate_address(address, len(buf))
+        self._read_into_nocheck(address, buf)
+    
+    def _read_into_nocheck(self, address, buf):
+        """read_into without range validation, for internal callers that already checked"""
+        mv = memoryview(buf)
+        length = len(mv)
+        if self._cache is not None:
+            mv[:] = memoryview(self._cache)[address:address + length]
+            return
+        
+        dev_addrs = self._dev_addrs
+        read_block_into = self._read_block_into
         
         # For reads crossing page boundaries, we need to handle address rollover
-        data = bytearray()
-        remaining = length
+        pos = 0
         current_addr = address
         
-        while remaining > 0:
-            # Calculate how many bytes we can read before hitting address boundary
-            current_device_addr = self._get_device_address(current_addr)
+        while pos < length:
+            # Each pass covers at most one 256-byte block, so the device
+            # address is resolved once per block
+            current_device_addr = dev_addrs[(current_addr >> 8) & 0x03]
             current_addr_byte = current_addr & 0xFF
             
             # Read up to the end of current 256-byte block or remaining bytes
-            bytes_to_read = min(remaining, 256 - current_addr_byte)
+            bytes_to_read = min(length - pos, 256 - current_addr_byte)
             
-            # Set address and read
-            self.i2c.writeto(current_device_addr, bytes([current_addr_byte]))
-            chunk = self.i2c.readfrom(current_device_addr, bytes_to_read)
-            data.extend(chunk)
+            # Set address and read into the matching slice of buf
+            read_block_into(current_device_addr, current_addr_byte, mv[pos:pos + bytes_to_read])
             
-            remaining -= bytes_to_read
+            pos += bytes_to_read
             current_addr += bytes_to_read
-        
-        return bytes(data)
     
     def write_byte(self, address, value):
         """
@@ -201,16 +309,27 @@ class EEPROM:
         if not (0 <= value <= 255):
             raise ValueError("Value must be 0-255")
         
+        page = address // self.PAGE_SIZE
+        if self._cache is not None and self._dirty[page >> 3] & (1 << (page & 7)):
+            # Page has unflushed buffered bytes: write it whole from the cache
+            self._write_bytes_nocheck(address, bytes((value,)), update=False)
+            return
+        
         device_addr = self._get_device_address(address)
-        addr_byte = address & 0xFF
+        tx_buf = self._tx_buf
+        tx_buf[0] = address & 0xFF
+        tx_buf[1] = value
         
         # Write address and data
-        self.i2c.writeto(device_addr, bytes([addr_byte, value]))
+        self.i2c.writeto(device_addr, self._tx_mv[:2])
         
         # Wait for write cycle to complete
         self._wait_write_complete(address)
+        
+        if self._cache is not None:
+            self._cache[address] = value
     
-    def write_bytes(self, address, data):
+    def write_bytes(self, address, data, update=True):
         """
         Write multiple bytes starting at the specified address
         Uses page write when possible for efficiency
@@ -218,6 +337,8 @@ class EEPROM:
         Args:
             address: Starting memory address
             data: bytes or list of integers to write
+            update: Read each page chunk first and skip the write cycle
+                    when it already holds the target bytes
         """
         if isinstance(data, (list, tuple)):
             data = bytes(data)
@@ -225,30 +346,80 @@ class EEPROM:
             data = bytes([data])
         
         self._validate_address(address, len(data))
+        self._write_bytes_nocheck(address, data, update)
+    
+    def _write_bytes_nocheck(self, address, data, update=True):
+        """
+        write_bytes without argument coercion or range validation
+        
+        For internal callers whose bytes-like data and range are already
+        known to be valid (erase paths, buffer_flush).
+        
+        With the RAM cache filled, a page that still has unflushed buffered
+        writes is merged with data in the cache and written whole, which
+        flushes it and clears its dirty bit.
+        """
+        # Slice page chunks out of a view so no intermediate copies are made
+        mv = memoryview(data)
+        length = len(data)
+        
+        # Local binds avoid attribute lookups on every page iteration
+        dev_addrs = self._dev_addrs
+        tx_buf = self._tx_buf
+        tx_mv = self._tx_mv
+        writeto = self.i2c.writeto
+        wait_write_complete = self._wait_write_complete
+        read_bytes = self._read_bytes_nocheck
+        page_size = self.PAGE_SIZE
+        cache = self._cache
+        dirty = self._dirty
         
         offset = 0
-        while offset < len(data):
+        while offset < length:
             current_addr = address + offset
             
             # Calculate page boundary - pages are 16 bytes aligned
-            page_start = (current_addr // self.PAGE_SIZE) * self.PAGE_SIZE
-            bytes_left_in_page = self.PAGE_SIZE - (current_addr - page_start)
+            bytes_left_in_page = page_size - (current_addr % page_size)
             
             # Write up to end of page or remaining data
-            chunk_size = min(bytes_left_in_page, len(data) - offset)
-            chunk_data = data[offset:offset + chunk_size]
+            chunk_size = min(bytes_left_in_page, length - offset)
+            chunk_data = mv[offset:offset + chunk_size]
+            
+            page = current_addr // page_size
+            page_bit = 1 << (page & 7)
+            if cache is not None and dirty[page >> 3] & page_bit:
+                # The page holds unflushed buffered bytes, so the device does
+                # not match the cache: write the merged page, never skip it
+                cache[current_addr:current_addr + chunk_size] = chunk_data
+                dirty[page >> 3] &= ~page_bit
+                write_addr = page * page_size
+                write_data = memoryview(cache)[write_addr:write_addr + page_size]
+            elif update and read_bytes(current_addr, chunk_size) == chunk_data:
+                # A page read is far cheaper than a write cycle (and saves
+                # endurance). A clean page's cache contents match the device,
+                # so a cached read is accurate here. Keep the bytes on the
+                # left: bytes == memoryview compares contents.
+                offset += chunk_size
+                continue
+            else:
+                write_addr = current_addr
+                write_data = chunk_data
             
-            device_addr = self._get_device_address(current_addr)
-            addr_byte = current_addr & 0xFF
+            write_size = len(write_data)
+            device_addr = dev_addrs[(write_addr >> 8) & 0x03]
+            tx_buf[0] = write_addr & 0xFF
+            tx_mv[1:1 + write_size] = write_data
             
-            # Page write: address byte followed by data bytes
-            write_data = bytes([addr_byte]) + chunk_data
-            self.i2c.writeto(device_addr, write_data)
+            # Page write: address byte followed by data bytes in one transaction
+            writeto(device_addr, tx_mv[:1 + write_size])
             
             # Wait for write cycle to complete
-            self._wait_write_complete(current_addr)
+            wait_write_complete(write_addr)
             
             offset += chunk_size
+        
+        if self._cache is not None:
+            self._cache[address:address + length] = data
     
     def erase_page(self, page_number):
         """
@@ -261,17 +432,140 @@ class EEPROM:
             raise ValueError("Page number out of range (0-63)")
         
         address = page_number * self.PAGE_SIZE
-        erase_data = bytes([0xFF] * self.PAGE_SIZE)
-        self.write_bytes(address, erase_data)
+        self._write_bytes_nocheck(address, self._ERASE_PAGE)
+    
+    def erase_range(self, start_addr, length):
+        """
+        Erase only the given address range (fill with 0xFF)
+        
+        Fully covered pages get a single page write; partially covered
+        first/last pages only have the covered bytes written, the rest of
+        the page is left untouched. Pages already erased are skipped.
+        
+        Args:
+            start_addr: First address to erase
+            length: Number of bytes to erase
+        """
+        self._validate_address(start_addr, length)
+        
+        end = start_addr + length
+        address = start_addr
+        while address < end:
+            chunk_size = min(self.PAGE_SIZE - (address % self.PAGE_SIZE), end - address)
+            self._write_bytes_nocheck(address, self._ERASE_PAGE[:chunk_size])
+            address += chunk_size
     
     def erase_all(self):
         """Erase entire EEPROM (fill with 0xFF)"""
-        print("Erasing entire EEPROM...")
+        # Fill the write frame with 0xFF once; only the address byte changes per page
+        tx_buf = self._tx_buf
+        tx_buf[1:] = self._ERASE_PAGE
+        dev_addrs = self._dev_addrs
+        for page in range(self.MEMORY_SIZE // self.PAGE_SIZE):
+            # Pages are aligned and in range by construction, so write each
+            # one directly instead of going through erase_page/write_bytes
+            address = page * self.PAGE_SIZE
+            tx_buf[0] = address & 0xFF
+            self.i2c.writeto(dev_addrs[address >> 8], tx_buf)
+            self._wait_write_complete(address)
+        # One summary line after the loop keeps serial output out of the write timing
+        if self.verbose:
+            print("Erased entire EEPROM ({} pages)".format(self.MEMORY_SIZE // self.PAGE_SIZE))
+        
+        if self._cache is not None:
+            self._cache[:] = b'\xff' * self.MEMORY_SIZE
+        # Every page now matches the cache, buffered changes included
+        for i in range(len(self._dirty)):
+            self._dirty[i] = 0
+    
+    @property
+    def is_buffer_filled(self):
+        """True once buffer_fill() has loaded the RAM mirror"""
+        return self._cache is not None
+    
+    def buffer_fill(self, force=False):
+        """
+        Load the entire EEPROM into the RAM write-back cache
+        
+        While the cache is filled, reads are served from RAM and
+        buffered_write_* calls only touch RAM until buffer_flush().
+        Does nothing if the cache is already filled, unless force is set
+        (which also discards any unflushed changes).
+        
+        Args:
+            force: Re-read the EEPROM even if the cache is already filled
+        """
+        if self._cache is not None and not force:
+            return
+        self._cache = None
+        self._cache = bytearray(self._read_bytes_nocheck(0, self.MEMORY_SIZE))
+        for i in range(len(self._dirty)):
+            self._dirty[i] = 0
+    
+    def buffered_write_byte(self, address, value):
+        """
+        Write a single byte to the RAM cache and mark its page dirty
+        
+        Args:
+            address: Memory address (0x000 to 0x3FF)
+            value: Byte value to write (0-255)
+        """
+        self._validate_address(address)
+        
+        if not (0 <= value <= 255):
+            raise ValueError("Value must be 0-255")
+        
+        self.buffer_fill()
+        self._cache[address] = value
+        page = address // self.PAGE_SIZE
+        self._dirty[page >> 3] |= 1 << (page & 7)
+    
+    def buffered_write_bytes(self, address, data):
+        """
+        Write multiple bytes to the RAM cache and mark their pages dirty
+        
+        Args:
+            address: Starting memory address
+            data: bytes or list of integers to write
+        """
+        if isinstance(data, (list, tuple)):
+            data = bytes(data)
+        elif isinstance(data, int):
+            data = bytes([data])
+        
+        self._validate_address(address, len(data))
+        
+        if not data:
+            return
+        
+        self.buffer_fill()
+        self._cache[address:address + len(data)] = data
+        for page in range(address // self.PAGE_SIZE, (address + len(data) - 1) // self.PAGE_SIZE + 1):
+            self._dirty[page >> 3] |= 1 << (page & 7)
+    
+    def buffer_flush(self):
+        """
+        Write every dirty page of the RAM cache back to the EEPROM
+        
+        Each dirty page costs one page write cycle, however many times it
+        was modified. The cache stays filled afterwards.
+        
+        Returns:
+            int: Number of pages written
+        """
+        if self._cache is None:
+            return 0
+        
+        written = 0
         for page in range(self.MEMORY_SIZE // self.PAGE_SIZE):
-            self.erase_page(page)
-            if page % 8 == 7:  # Progress indicator
-                print(".", end="")
-        print(" Done!")
+            if self._dirty[page >> 3] & (1 << (page & 7)):
+                address = page * self.PAGE_SIZE
+                # The cache already holds the new data, so never skip as unchanged
+                self._write_bytes_nocheck(address, self._cache[address:address + self.PAGE_SIZE], update=False)
+                written += 1
+        for i in range(len(self._dirty)):
+            self._dirty[i] = 0
+        return written
     
     def dump_hex(self, start_addr=0, length=None, bytes_per_line=16):
         """
@@ -290,17 +584,14 @@ class EEPROM:
         for i in range(0, length, bytes_per_line):
             addr = start_addr + i
             chunk_size = min(bytes_per_line, length - i)
-            data = self.read_bytes(addr, chunk_size)
+            data = self._read_bytes_nocheck(addr, chunk_size)
             
             # Format address
             line = "0x{:03X}: ".format(addr)
             
-            # Format hex bytes
-            hex_part = ""
-            ascii_part = ""
-            for j in range(chunk_size):
-                hex_part += "{:02X} ".format(data[j])
-                ascii_part += chr(data[j]) if 32 <= data[j] <= 126 else "."
+            # Format hex bytes (bytes.translate is not available on MicroPython)
+            hex_part = binascii.hexlify(data, ' ').decode().upper() + " "
+            ascii_part = ''.join([_ASCII_TBL[b] for b in data])
             
             # Pad hex part if needed
             hex_part = hex_part.ljust(bytes_per_line * 3)
@@ -71,6 +71,7 @@ Dependencies:
 - ads7828.py (ADS7828 driver)
 - MicroPython machine.I2C
 - time
+- array
 ================================================================================
 """
 
@@ -78,87 +79,122 @@ from machine import I2C
 import ads1x15
 import ads7828
 import time
+import array
 
 class AnalogDriver:
-    def __init__(self, i2c, config):
+    # Rate mapping (SPS to rate index for ADS1x15 driver)
+    rate_map = {
+        8: 0,    # 128/8 SPS for ADS1115/ADS1015
+        16: 1,   # 250/16 SPS
+        32: 2,   # 490/32 SPS
+        64: 3,   # 920/64 SPS
+        128: 4,  # 1600/128 SPS (default)
+        250: 5,  # 2400/250 SPS
+        475: 6,  # 3300/475 SPS
+        860: 7   # -/860 SPS
+    }
+    
+    # Measurement range lookup table (constant, shared by all instances)
+    # Binary format: 0bPCRR (P=Polarity, C=Current, RR=Range)
+    # Keys are the integer range codes; config strings are converted once on load.
+    range_configs = {
+        # Voltage ranges (bit 5 = 0)
+        0b00000001: {'type': 'voltage', 'min': 0, 'max': 0.5, 'bipolar': False, 'ads_gain': 4},
+        0b00000010: {'type': 'voltage', 'min': 0, 'max': 5.0, 'bipolar': False, 'ads_gain': 1},
+        0b00000011: {'type': 'voltage', 'min': 0, 'max': 10.0, 'bipolar': False, 'ads_gain': 0},
+        0b10000001: {'type': 'voltage', 'min': -0.5, 'max': 0.5, 'bipolar': True, 'ads_gain': 4},
+        0b10000010: {'type': 'voltage', 'min': -5.0, 'max': 5.0, 'bipolar': True, 'ads_gain': 1},
+        0b10000011: {'type': 'voltage', 'min': -10.0, 'max': 10.0, 'bipolar': True, 'ads_gain': 0},
+        # Current ranges (bit 5 = 1)
+        0b00100001: {'type': 'current', 'min': 0, 'max': 20, 'bipolar': False, 'ads_gain': 1},
+        0b10100001: {'type': 'current', 'min': -20, 'max': 20, 'bipolar': True, 'ads_gain': 1},
+        0b00100010: {'type': 'current', 'min': 4, 'max': 20, 'bipolar': False, 'ads_gain': 1},
+        0b00100011: {'type': 'current', 'min': 0, 'max': 40, 'bipolar': False, 'ads_gain': 0}
+    }
+    
+    # ADS1115 gain settings and their corresponding full-scale ranges,
+    # indexed by gain index (0-5)
+    ads_gains = (
+        (6.144, 0),   # ±6.144V, 2/3x gain
+        (4.096, 1),   # ±4.096V, 1x gain
+        (2.048, 2),   # ±2.048V, 2x gain
+        (1.024, 3),   # ±1.024V, 4x gain
+        (0.512, 4),   # ±0.512V, 8x gain
+        (0.256, 5)    # ±0.256V, 16x gain
+    )
+    
+    def __init__(self, i2c, config, verbose=False):
         """
         Initialize the Analog Driver with configuration from JSON.
         
         Args:
             i2c: Initialized I2C bus object
             config: Configuration dictionary containing:
-                - adc_i2c_addrs: List of ADC I2C addresses (hex strings)
+                - adc_i2c_addrs: List of ADC I2C addresses (ints or hex strings)
                 - adc_sampling_rate: Sampling rate in SPS
                 - channels: List of channel configurations with analog settings
+            verbose: Print initialization progress and read errors
+                     (print_channel_configs always prints)
         """
         self.i2c = i2c
         self.config = config
+        self.verbose = verbose
         self.adcs = []
         self.channel_configs = {}
 
         mezzanine_type = (self.config.get('mezzanine_type') or '').strip()
         self._use_ads7828 = mezzanine_type == "IoTextra Analog 3"
         
-        # Rate mapping (SPS to rate index for ADS1x15 driver)
-        self.rate_map = {
-            8: 0,    # 128/8 SPS for ADS1115/ADS1015
-            16: 1,   # 250/16 SPS
-            32: 2,   # 490/32 SPS
-            64: 3,   # 920/64 SPS
-            128: 4,  # 1600/128 SPS (default)
-            250: 5,  # 2400/250 SPS
-            475: 6,  # 3300/475 SPS
-            860: 7   # -/860 SPS
-        }
-        
-        # ADS1115 gain settings and their corresponding full-scale ranges
-        self.ads_gains = {
-            0: (6.144, 0),   # ±6.144V, 2/3x gain
-            1: (4.096, 1),   # ±4.096V, 1x gain
-            2: (2.048, 2),   # ±2.048V, 2x gain
-            3: (1.024, 3),   # ±1.024V, 4x gain
-            4: (0.512, 4),   # ±0.512V, 8x gain
-            5: (0.256, 5)    # ±0.256V, 16x gain
-        }
-        
-        # Measurement range lookup table
-        # Binary format: 0bPCRR (P=Polarity, C=Current, RR=Range)
-        self.range_configs = {
-            # Voltage ranges (bit 5 = 0)
-            0b00000001: {'type': 'voltage', 'min': 0, 'max': 0.5, 'bipolar': False, 'ads_gain': 4},
-            0b00000010: {'type': 'voltage', 'min': 0, 'max': 5.0, 'bipolar': False, 'ads_gain': 1},
-            0b00000011: {'type': 'voltage', 'min': 0, 'max': 10.0, 'bipolar': False, 'ads_gain': 0},
-            0b10000001: {'type': 'voltage', 'min': -0.5, 'max': 0.5, 'bipolar': True, 'ads_gain': 4},
-            0b10000010: {'type': 'voltage', 'min': -5.0, 'max': 5.0, 'bipolar': True, 'ads_gain': 1},
-            0b10000011: {'type': 'voltage', 'min': -10.0, 'max': 10.0, 'bipolar': True, 'ads_gain': 0},
-            # Current ranges (bit 5 = 1)
-            0b00100001: {'type': 'current', 'min': 0, 'max': 20, 'bipolar': False, 'ads_gain': 1},
-            0b10100001: {'type': 'current', 'min': -20, 'max': 20, 'bipolar': True, 'ads_gain': 1},
-            0b00100010: {'type': 'current', 'min': 4, 'max': 20, 'bipolar': False, 'ads_gain': 1},
-            0b00100011: {'type': 'current', 'min': 0, 'max': 40, 'bipolar': False, 'ads_gain': 0}
-        }
+        # ADS1x15 rate index for the configured sampling rate, resolved once
+        sampling_rate = self.config.get('hardware', {}).get('adc_sampling_rate', 128)
+        self._rate_idx = self.rate_map.get(sampling_rate, 4)  # Default to 128 SPS
         
         self._initialize_adcs()
+        self._build_channel_table()
         self._parse_channel_configs()
+        self._group_channels_by_adc()
     
     def _initialize_adcs(self):
         """Initialize all ADCs from the configuration."""
         adc_addrs = self.config.get('hardware', {}).get('adc_i2c_addrs', [])
         
-        for addr_str in adc_addrs:
+        for addr in adc_addrs:
             try:
-                addr = int(addr_str, 16)
+                if isinstance(addr, str):
+                    addr = int(addr, 16)
                 if self._use_ads7828:
                     adc = ads7828.ADS7828(self.i2c, addr)
                     self.adcs.append({'address': addr, 'instance': adc})
-                    print(f"Initialized ADS7828 at address {addr_str}")
+                    if self.verbose:
+                        print(f"Initialized ADS7828 at address {hex(addr)}")
                 else:
                     # Initialize with default gain=1, will be set per channel read
                     adc = ads1x15.ADS1115(self.i2c, addr, gain=1)
                     self.adcs.append({'address': addr, 'instance': adc})
-                    print(f"Initialized ADS1115 at address {addr_str}")
+                    if self.verbose:
+                        print(f"Initialized ADS1115 at address {hex(addr)}")
             except Exception as e:
-                print(f"Error initializing ADC at {addr_str}: {e}")
+                if self.verbose:
+                    print(f"Error initializing ADC at {addr}: {e}")
+    
+    def _build_channel_table(self):
+        """
+        Precompute channel_number -> (adc_instance, channel_spec) for every
+        channel the initialized ADCs can serve (see _get_adc_for_channel).
+        Must be rebuilt (and _group_channels_by_adc rerun) whenever an entry
+        of self.adcs is replaced.
+        """
+        table = []
+        for adc_entry in self.adcs:
+            adc = adc_entry['instance']
+            if self._use_ads7828:
+                for ch in range(8):
+                    table.append((adc, (ch, None)))
+            else:
+                # Map to differential pairs: 0 -> (0,1), 1 -> (2,3)
+                table.append((adc, (0, 1)))
+                table.append((adc, (2, 3)))
+        self._ch_table = table
     
     def _parse_channel_configs(self):
         """Parse channel configurations for analog channels."""
@@ -169,34 +205,93 @@ class AnalogDriver:
             if int(channel.get('channel_type')) == 2:
                 ch_num = channel.get('channel_number')
                 
-                # Parse measurement range (binary string or integer)
-                range_code = channel.get('measurement_range', '0b00000010')
+                # Parse measurement range (binary string or integer) - the only
+                # conversion; everything downstream uses the integer range_code
+                range_code = channel.get('measurement_range', 0b00000010)
                 if isinstance(range_code, str):
                     range_code = int(range_code, 2)
                 
                 # Get range configuration
                 range_config = self.range_configs.get(range_code, None)
                 if range_config is None:
-                    print(f"Warning: Unknown measurement range {bin(range_code)} for channel {ch_num}")
+                    if self.verbose:
+                        print(f"Warning: Unknown measurement range {bin(range_code)} for channel {ch_num}")
+                    continue
+                
+                # Scaling divides by these (see _build_scaling_arrays); a zero
+                # shunt only matters on current ranges
+                hardware_gain = channel.get('adc_hardware_gain', 0.23761904761904762)
+                shunt_resistance = channel.get('shunt_resistance', 0.249)
+                if not hardware_gain or (range_config['type'] == 'current' and not shunt_resistance):
+                    if self.verbose:
+                        print(f"Warning: Zero hardware gain or shunt resistance for channel {ch_num}, skipping")
                     continue
                 
                 # Build channel configuration
                 self.channel_configs[ch_num] = {
                     'name': channel.get('name', f'Channel {ch_num}'),
-                    'measurement_range': bin(range_code),  # Store as binary string for compatibility
                     'type': range_config['type'],
                     'min': range_config['min'],
                     'max': range_config['max'],
                     'bipolar': range_config['bipolar'],
                     'ads_gain': range_config['ads_gain'],
-                    'hardware_gain': channel.get('adc_hardware_gain', 0.23761904761904762),
-                    'shunt_resistance': channel.get('shunt_resistance', 0.249),
+                    'hardware_gain': hardware_gain,
+                    'shunt_resistance': shunt_resistance,
                     'offset': channel.get('adc_offset', 0.0),
                     'range_code': range_code
                 }
                 
-                print(f"Configured channel {ch_num}: {self.channel_configs[ch_num]['name']}, "
-                      f"type={range_config['type']}, range={range_config['min']} to {range_config['max']}")
+                if self.verbose:
+                    print(f"Configured channel {ch_num}: {self.channel_configs[ch_num]['name']}, "
+                          f"type={range_config['type']}, range={range_config['min']} to {range_config['max']}")
+        
+        self._build_scaling_arrays()
+    
+    def _build_scaling_arrays(self):
+        """
+        Flatten the numeric scaling of every configured channel into parallel
+        arrays indexed by channel number, so the read path does plain indexed
+        arithmetic instead of dict lookups. channel_configs stays a dict of
+        dicts: main.py (unit lookup), get_channel_info and
+        print_channel_configs read it outside the sampling path.
+        """
+        n = max(self.channel_configs) + 1 if self.channel_configs else 0
+        zeros = [0.0] * n
+        self._is_current = bytearray(n)
+        self._min = array.array('f', zeros)
+        self._max = array.array('f', zeros)
+        self._gain_inv = array.array('f', zeros)
+        self._shunt_inv = array.array('f', zeros)
+        self._offset = array.array('f', zeros)
+        for ch_num, ch_cfg in self.channel_configs.items():
+            is_current = ch_cfg['type'] == 'current'
+            self._is_current[ch_num] = is_current
+            self._min[ch_num] = ch_cfg['min']
+            self._max[ch_num] = ch_cfg['max']
+            self._gain_inv[ch_num] = 1.0 / ch_cfg['hardware_gain']
+            if is_current:
+                # Voltage channels never use the shunt, so it is not inverted
+                self._shunt_inv[ch_num] = 1.0 / ch_cfg['shunt_resistance']
+            self._offset[ch_num] = ch_cfg['offset']
+    
+    def _group_channels_by_adc(self):
+        """
+        Build the read plan used by read_all_analog_channels.
+        
+        Channels are grouped per ADC (adc_instance -> [(ch_num, ads_gain, channel_spec), ...])
+        and ordered by gain then input pair, with each channel's ADC, inputs
+        and gain resolved once here instead of looked up per read. This saves
+        Python-level lookups only: ADS1115.read() still writes the full
+        config register (gain included) on every conversion. The mapping
+        comes from _ch_table; channels no ADC serves are grouped under None.
+        """
+        self._channels_by_adc = {}
+        for ch_num, ch_cfg in self.channel_configs.items():
+            adc, channel_spec = self._get_adc_for_channel(ch_num)
+            self._channels_by_adc.setdefault(adc, []).append(
+                (ch_num, ch_cfg['ads_gain'], channel_spec))
+        for entries in self._channels_by_adc.values():
+            entries.sort(key=lambda entry: (entry[1], entry[2]))
     
     def _get_adc_for_channel(self, channel_number):
         """
@@ -216,27 +311,9 @@ class AnalogDriver:
               - ADS1115: channel_spec is (ch1, ch2) differential pair
               - ADS7828: channel_spec is (ch, None) single-ended channel
         """
-        if self._use_ads7828:
-            adc_index = channel_number // 8
-            ch = channel_number % 8
-            if adc_index >= len(self.adcs):
-                return None, None
-            adc = self.adcs[adc_index]['instance']
-            return adc, (ch, None)
-
-        adc_index = channel_number // 2
-        pair_index = channel_number % 2
-
-        if adc_index >= len(self.adcs):
-            return None, None
-
-        adc = self.adcs[adc_index]['instance']
-
-        # Map to differential pairs: 0 -> (0,1), 1 -> (2,3)
-        if pair_index == 0:
-            return adc, (0, 1)
-        else:
-            return adc, (2, 3)
+        if 0 <= channel_number < len(self._ch_table):
+            return self._ch_table[channel_number]
+        return None, None
     
     def read_channel_raw(self, channel_number):
         """
@@ -251,32 +328,49 @@ class AnalogDriver:
         adc, channels = self._get_adc_for_channel(channel_number)
 
         if adc is None:
-            print(f"Error: No ADC configured for channel {channel_number}")
+            if self.verbose:
+                print(f"Error: No ADC configured for channel {channel_number}")
             return None
 
+        ch_cfg = self.channel_configs.get(channel_number)
+        ads_gain = ch_cfg['ads_gain'] if ch_cfg is not None else None
+        return self._read_raw(channel_number, adc, channels, ads_gain)
+    
+    def _read_raw(self, channel_number, adc, channels, ads_gain):
+        """
+        One conversion on adc for the given input spec (see
+        _get_adc_for_channel). Shared by read_channel_raw and
+        read_all_analog_channels.
+        
+        Args:
+            channel_number: Channel number (for error messages)
+            adc: ADC instance serving the channel
+            channels: Input spec, (ch1, ch2) pair or (ch, None)
+            ads_gain: ADS1115 gain index, or None to keep the ADC's current gain
+            
+        Returns:
+            int: Raw ADC value, or None on error
+        """
         try:
             # ADS7828 (single-ended)
             if self._use_ads7828:
                 return adc.read_channel(channels[0])
 
-            # ADS1115: apply per-channel gain before reading (shared ADC)
-            ch_cfg = self.channel_configs.get(channel_number)
-            if ch_cfg is not None:
-                adc.gain = ch_cfg.get('ads_gain', adc.gain)
-
-            # Get sampling rate
-            sampling_rate = self.config.get('hardware', {}).get('adc_sampling_rate', 128)
-            rate_idx = self.rate_map.get(sampling_rate, 4)  # Default to 128 SPS
+            # ADS1115: set per-channel gain (shared ADC). This is a Python
+            # attribute; read() writes it with the config register.
+            if ads_gain is not None:
+                adc.gain = ads_gain
 
             # Perform differential read
             return adc.read(
-                rate=rate_idx,
+                rate=self._rate_idx,
                 channel1=channels[0],
                 channel2=channels[1]
             )
 
         except Exception as e:
-            print(f"Error reading channel {channel_number}: {e}")
+            if self.verbose:
+                print(f"Error reading channel {channel_number}: {e}")
             return None
     
     def read_channel_voltage(self, channel_number):
@@ -312,31 +406,37 @@ class AnalogDriver:
             float: Physical value (V or mA), or None on error
         """
         if channel_number not in self.channel_configs:
-            print(f"Error: Channel {channel_number} not configured")
+            if self.verbose:
+                print(f"Error: Channel {channel_number} not configured")
             return None
         
-        config = self.channel_configs[channel_number]
-        
         # Read ADC voltage
         adc_voltage = self.read_channel_voltage(channel_number)
         if adc_voltage is None:
             return None
         
+        return self._to_physical(channel_number, adc_voltage)
+    
+    def _to_physical(self, ch_num, adc_voltage):
+        """Convert an ADC voltage to V or mA using the channel's scaling arrays."""
         # Apply hardware gain (divide by K to get actual voltage)
-        scaled_voltage = adc_voltage / config['hardware_gain']
+        physical_value = adc_voltage * self._gain_inv[ch_num]
         
         # Convert based on measurement type
-        if config['type'] == 'voltage':
-            physical_value = scaled_voltage
-        else:  # current
+        if self._is_current[ch_num]:
             # I = V / R (voltage across shunt resistor)
-            physical_value = (scaled_voltage / config['shunt_resistance'])
+            physical_value *= self._shunt_inv[ch_num]
         
         # Apply offset
-        physical_value += config['offset']
+        physical_value += self._offset[ch_num]
         
         # Clamp to range
-        physical_value = max(config['min'], min(config['max'], physical_value))
+        lo = self._min[ch_num]
+        hi = self._max[ch_num]
+        if physical_value < lo:
+            physical_value = lo
+        elif physical_value > hi:
+            physical_value = hi
         
         return physical_value
     
@@ -348,37 +448,61 @@ class AnalogDriver:
             dict: Dictionary mapping channel_number -> physical_value
         """
         results = {}
-        for ch_num in self.channel_configs.keys():
-            value = self.read_channel_physical(ch_num)
-            results[ch_num] = value
+        read_raw = self._read_raw
+        # First pass: sample every channel into a flat voltage array
+        volts = array.array('f', bytes(4 * len(self._gain_inv)))
+        sampled = []
+        
+        for adc, entries in self._channels_by_adc.items():
+            for ch_num, ads_gain, channel_spec in entries:
+                if adc is None:
+                    if self.verbose:
+                        print(f"Error: No ADC configured for channel {ch_num}")
+                    results[ch_num] = None
+                    continue
+                raw_value = read_raw(ch_num, adc, channel_spec, ads_gain)
+                if raw_value is None:
+                    results[ch_num] = None
+                    continue
+                volts[ch_num] = adc.raw_to_v(raw_value)
+                sampled.append(ch_num)
+        
+        # Second pass: scale the sampled voltages (same conversion as
+        # read_channel_physical)
+        to_physical = self._to_physical
+        for ch_num in sampled:
+            results[ch_num] = to_physical(ch_num, volts[ch_num])
         return results
     
     def set_channel_gain(self, channel_number, gain_index):
         """
         Set the ADS1115 gain for a specific channel's ADC.
-        Note: This reinitializes the ADC instance with the new gain.
+        Note: The gain is stored on the existing ADC instance and applied
+        with the config register write of its next conversion.
         
         Args:
             channel_number: Channel number
             gain_index: Gain index (0-5)
         """
         if self._use_ads7828:
-            print("Warning: ADS7828 does not support programmable gain")
+            if self.verbose:
+                print("Warning: ADS7828 does not support programmable gain")
             return
 
         adc_index = channel_number // 2
         if adc_index >= len(self.adcs):
-            print(f"Error: No ADC for channel {channel_number}")
+            if self.verbose:
+                print(f"Error: No ADC for channel {channel_number}")
             return
         
-        addr = self.adcs[adc_index]['address']
-        try:
-            # Reinitialize ADC with new gain
-            new_adc = ads1x15.ADS1115(self.i2c, addr, gain=gain_index)
-            self.adcs[adc_index]['instance'] = new_adc
-            print(f"Set gain {gain_index} for ADC at 0x{addr:02X}")
-        except Exception as e:
-            print(f"Error setting gain: {e}")
+        if not 0 <= gain_index < len(self.ads_gains):
+            if self.verbose:
+                print(f"Error setting gain: invalid gain index {gain_index}")
+            return
+        
+        self.adcs[adc_index]['instance'].gain = gain_index
+        if self.verbose:
+            print(f"Set gain {gain_index} for ADC at 0x{self.adcs[adc_index]['address']:02X}")
     
     def get_channel_info(self, channel_number):
         """
@@ -395,14 +519,17 @@ class AnalogDriver:
     def print_channel_configs(self):
         """Print all configured analog channels."""
         print("\n=== Analog Channel Configuration ===")
+        # One print per channel: each print is a separate console write
         for ch_num, config in self.channel_configs.items():
-            print(f"Channel {ch_num}: {config['name']}")
-            print(f"  Type: {config['type']}")
-            print(f"  Range: {config['min']} to {config['max']}")
-            print(f"  Bipolar: {config['bipolar']}")
-            print(f"  ADS Gain: {config['ads_gain']} (±{self.ads_gains[config['ads_gain']][0]}V)")
-            print(f"  Hardware Gain (K): {config['hardware_gain']}")
+            lines = [
+                f"Channel {ch_num}: {config['name']}",
+                f"  Type: {config['type']}",
+                f"  Range: {config['min']} to {config['max']}",
+                f"  Bipolar: {config['bipolar']}",
+                f"  ADS Gain: {config['ads_gain']} (±{self.ads_gains[config['ads_gain']][0]}V)",
+                f"  Hardware Gain (K): {config['hardware_gain']}",
+            ]
             if config['type'] == 'current':
-                print(f"  Shunt Resistance: {config['shunt_resistance']} Ω")
-            print(f"  Offset: {config['offset']}")
-            print()
+                lines.append(f"  Shunt Resistance: {config['shunt_resistance']} Ω")
+            lines.append(f"  Offset: {config['offset']}\n")
+            print("\n".join(lines))
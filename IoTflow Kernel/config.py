@@ -142,31 +142,33 @@ STATUS_UPDATE_INTERVAL_S = 30 # How often to publish status updates (in seconds)
 # by iso1211_driver.py, NOT by the standard DI driver. Direct-mode
 # channels (12-60V DC, JM closed) stay on the existing DI driver unchanged.
 #
-# A sampled-mode channel uses channel_type "3" and these fields:
-#   "channel_type":   "3"            -> ISO1211 sampled-mode DI
-#   "interface_type": "01" or "11"   -> OUT read source (same as standard DI):
-#                                       "01" = direct MCU GPIO pin (out_source "gpio")
-#                                       "11" = TCA9534 I2C expander  (out_source "i2c")
+# A sampled-mode channel uses channel_type 3 and these fields:
+#   "channel_type":   3              -> ISO1211 sampled-mode DI
+#   "interface_type": 1 or 11        -> OUT read source (same as standard DI):
+#                                       1  = direct MCU GPIO pin (out_source "gpio")
+#                                       11 = TCA9534 I2C expander  (out_source "i2c")
+#                                       (IoTflow Forge sends the codes as "3", "01", "11";
+#                                        both forms are accepted)
 #   "channel_number": 0-7            -> OUT position (TCA9534 bit / HOST-pin lookup) + MQTT topic
 #   "actions":        0              -> read-only
 #   "fgnd_gpio":      <pin number>   -> HOST pin driving TLP188/FGND. REQUIRED and
 #                                       UNIQUE to sampled mode. Invalid/missing -> channel skipped.
-#   "out_gpio":       <pin number>   -> OPTIONAL, only for interface_type "01". Explicit OUT pin;
+#   "out_gpio":       <pin number>   -> OPTIONAL, only for interface_type 1. Explicit OUT pin;
 #                                       defaults to GPIO_HOST_PINS[channel_number + 1] if omitted.
 #
 # Example (uncomment / load via EEPROM to use on a Quadro module):
 # CHANNELS = [
 #     {"name": "IN1", 
-#      "channel_type": "3", 
-#      "interface_type": "11",
+#      "channel_type": 3, 
+#      "interface_type": 11,
 #      "channel_number": 0, 
 #      "actions": 0, 
 #      "fgnd_gpio": 17
 #      # OUT via TCA9534 bit 0
 #     },
 #     {"name": "IN2", 
-#      "channel_type": "3", 
-#      "interface_type": "01",
+#      "channel_type": 3, 
+#      "interface_type": 1,
 #      "channel_number": 1, 
 #      "actions": 0, 
 #      "fgnd_gpio": 18, 
@@ -177,44 +179,44 @@ STATUS_UPDATE_INTERVAL_S = 30 # How often to publish status updates (in seconds)
 CHANNELS = [
     {
       "name": "Sensor A",
-      "channel_type": "2",
-      "interface_type": "01",
+      "channel_type": 2,
+      "interface_type": 1,
       "channel_number": 0,
       "actions": 0,
-      "measurement_range": "0b10000011",
+      "measurement_range": 0b10000011,
       "adc_hardware_gain": 0.23761904761904762,
       "shunt_resistance": 0.249,
       "adc_offset": 0.0
     },
     {
       "name": "Sensor B",
-      "channel_type": "2",
-      "interface_type": "01",
+      "channel_type": 2,
+      "interface_type": 1,
       "channel_number": 1,
       "actions": 0,
-      "measurement_range": "0b10100001",
+      "measurement_range": 0b10100001,
       "adc_hardware_gain": 0.23761904761904762,
       "shunt_resistance": 0.249,
       "adc_offset": 0.0
     },
     {
       "name": "Sensor C",
-      "channel_type": "2",
-      "interface_type": "01",
+      "channel_type": 2,
+      "interface_type": 1,
       "channel_number": 2,
       "actions": 0,
-      "measurement_range": "0b10000011",
+      "measurement_range": 0b10000011,
       "adc_hardware_gain": 0.23761904761904762,
       "shunt_resistance": 0.249,
       "adc_offset": 0.0
     },
     {
       "name": "Sensor D",
-      "channel_type": "2",
-      "interface_type": "01",
+      "channel_type": 2,
+      "interface_type": 1,
       "channel_number": 3,
       "actions": 0,
-      "measurement_range": "0b10100001",
+      "measurement_range": 0b10100001,
       "adc_hardware_gain": 0.23761904761904762,
       "shunt_resistance": 0.249,
       "adc_offset": 0.0
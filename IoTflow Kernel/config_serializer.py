@@ -29,6 +29,49 @@
  deserialization for IoTextra firmware configuration data.
  The format is compact, deterministic, and EEPROM-safe.
 
+ Binary layout (big-endian; str = 1-byte length + UTF-8 bytes):
+
+   version            u8    _CONFIG_VERSION
+   crc                u16   CRC-16/CCITT-FALSE of everything after it
+   module_type        str
+   mezzanine_type     str
+   num_channels       u8
+   channel[n]:
+     name             str
+     channel_type     u8
+     interface_type   u8
+     channel_number   u8
+     actions          u8
+     fields_mask      u8    which optional fields follow, in this order:
+       0x01 measurement_range  u8
+       0x02 adc_hardware_gain  f32, or u16 (x10000) when 0x40 is set
+       0x04 shunt_resistance   u16  (x1000)
+       0x08 adc_offset         u16  (x1000)
+       0x10 fgnd_gpio          u8
+       0x20 out_gpio           u8
+       0x40 (no field) adc_hardware_gain is stored as u16 fixed point
+                       (0.1..6.5535, error <= 0.00005; f32 otherwise)
+   wifi_ssid          str
+   wifi_password      str
+   mqtt broker        str
+   mqtt port          u16
+   mqtt client_id     str
+   mqtt base_topic    str
+   hardware mode      str
+   i2c_bus_id, i2c_sda_pin, i2c_scl_pin, i2c_device_addr,
+   eeprom_i2c_addr    u8 each
+   eeprom_size        u16
+   gpio_host_pins     u32  (pins 1-8 as 4-bit nibbles, pin 1 first)
+   num_adcs           u8
+   adc_i2c_addrs      u8 x num_adcs
+   adc_sampling_rate  u16
+   pin_config         u8
+   status_interval_s  u8
+
+ Images written before the version/CRC header existed start directly
+ at module_type. unpack_config still reads those (without a CRC check),
+ and main.py rewrites them in this format the first time it reads one.
+
  Author: Arshia Keshvari
  Role: Independent Developer, Engineer, and Project Author
  Last Updated: 2026/06/20
@@ -36,21 +79,183 @@
 """
 
 import struct
+import array
+
+try:
+    import micropython
+except ImportError:
+    # CPython (host-side tools/tests): the MicroPython code emitters are
+    # compiler directives there, so stand in with no-op decorators
+    class micropython:
+        @staticmethod
+        def viper(func):
+            return func
+
+# Fixed record layouts. MicroPython's struct module has no Struct class,
+# so the formats are module constants with their sizes computed once.
+_CH_HDR = ">BBBBB"   # channel_type, interface_type, channel_number, actions, fields mask
+_CH_HDR_SIZE = struct.calcsize(_CH_HDR)
+# i2c bus id, SDA, SCL, device addr, EEPROM addr, eeprom_size, GPIO nibble word
+_HW_FIXED = ">BBBBBHI"
+_HW_FIXED_SIZE = struct.calcsize(_HW_FIXED)
+_U16 = ">H"
+_F32 = ">f"
+_PINCFG = ">BB"      # pin_config, status interval
+_ADC_FHH = ">fHH"    # adc_hardware_gain, shunt_resistance, adc_offset (all present)
+_ADC_FHH_SIZE = struct.calcsize(_ADC_FHH)
+_ADC_HHH = ">HHH"    # same, with the gain in fixed point (_GAIN_FIXED set)
+_ADC_HHH_SIZE = struct.calcsize(_ADC_HHH)
+
+# Channel fields mask bits
+#   0x01 measurement_range, 0x02 adc_hardware_gain, 0x04 shunt_resistance,
+#   0x08 adc_offset, 0x10 fgnd_gpio, 0x20 out_gpio
+_ADC_CAL_FLAGS = 0x0E   # gain + shunt + offset, packed together as _ADC_FHH
+_GAIN_FIXED = 0x40      # adc_hardware_gain stored as u16 x _GAIN_SCALE, not f32
+_GAIN_SCALE = 10000
+# Smallest gain (x _GAIN_SCALE) kept in fixed point: below 0.1 the rounding
+# error would exceed 0.05% of the gain
+_GAIN_FIXED_MIN = 1000
+# Leading version byte. The high bit keeps it apart from the module_type
+# length that untagged (pre-version) images start with.
+_CONFIG_VERSION = 0x81
+_TAG = ">BH"         # version, CRC-16 of the body
+_TAG_SIZE = struct.calcsize(_TAG)
+
+# Largest per-channel record after the name: header + every optional field
+_CH_MAX_SIZE = _CH_HDR_SIZE + 1 + 4 + 2 + 2 + 1 + 1
+# "0b" + 8-digit binary string for every byte value (measurement_range, pin_config)
+_BIN8 = tuple("0b" + "{:08b}".format(i) for i in range(256))
 
 # ----------------------------
 # Helpers
 # ----------------------------
 
+def _crc16_table():
+    table = array.array('H', [0] * 256)
+    for i in range(256):
+        crc = i << 8
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x1021 if crc & 0x8000 else crc << 1) & 0xFFFF
+        table[i] = crc
+    return table
+
+_CRC16_TABLE = _crc16_table()
+
+
+def _crc16(data, crc: int = 0xFFFF) -> int:
+    # CRC-16/CCITT-FALSE, same as CPython's binascii.crc_hqx(data, 0xFFFF)
+    # (MicroPython's binascii only has crc32)
+    table = _CRC16_TABLE
+    for b in data:
+        crc = ((crc << 8) & 0xFFFF) ^ table[(crc >> 8) ^ b]
+    return crc
+
+
 def pack_string(s: str) -> bytes:
-    b = s.encode("utf-8")
-    if len(b) > 255:
-        raise ValueError("String too long for 1-byte length prefix")
-    return struct.pack("B", len(b)) + b
+    # Standalone form of _write_string, which pack_config uses to write
+    # strings in place
+    buf = bytearray(_string_bound(s))
+    n = _write_string(buf, 0, s)
+    return bytes(memoryview(buf)[:n])
+
+
+@micropython.viper
+def _pack_nibbles(a: int, b: int, c: int, d: int) -> int:
+    # Four 4-bit values into 16 bits, a in the top nibble. Viper takes at
+    # most 4 arguments and works on signed machine words, so the 8 GPIO
+    # nibbles are packed as two 16-bit halves.
+    return ((a & 0x0F) << 12) | ((b & 0x0F) << 8) | ((c & 0x0F) << 4) | (d & 0x0F)
+
+
+def _string_bound(s: str) -> int:
+    # Length prefix + worst-case UTF-8 size (4 bytes per code point)
+    return 1 + 4 * len(s)
 
 
-def unpack_string(buf: bytes, offset: int):
+def _write_string(buf, offset: int, s: str) -> int:
+    # Write a length-prefixed string into buf at offset; returns the new offset
+    b = s.encode("utf-8")
+    n = len(b)
+    if n > 255:
+        raise ValueError("String too long for 1-byte length prefix")
+    buf[offset] = n
+    buf[offset+1:offset+1+n] = b
+    return offset + 1 + n
+
+
+def _as_int(value, base: int = 10) -> int:
+    # Bit-field / code values may arrive as ints or as their string form
+    # ("0b10000011", "01") from IoTflow Forge JSON; both pack to one byte.
+    return value if isinstance(value, int) else int(value, base)
+
+
+def _as_hex(value) -> str:
+    return hex(value) if isinstance(value, int) else value
+
+
+def format_addrs(cfg: dict) -> dict:
+    # unpack_config returns I2C addresses as ints. This gives a copy with
+    # them as "0x.." strings, the form IoTflow Forge and debug prints expect.
+    # gpio_host_pins gets string keys as well (MicroPython's json does not
+    # quote int keys).
+    hw = dict(cfg["hardware"])
+    hw["i2c_device_addr"] = _as_hex(hw["i2c_device_addr"])
+    hw["eeprom_i2c_addr"] = _as_hex(hw["eeprom_i2c_addr"])
+    hw["adc_i2c_addrs"] = [_as_hex(a) for a in hw.get("adc_i2c_addrs", [])]
+    hw["gpio_host_pins"] = {str(k): v for k, v in hw["gpio_host_pins"].items()}
+    out = dict(cfg)
+    out["hardware"] = hw
+    return out
+
+
+def format_config(cfg: dict) -> dict:
+    # Copy of an unpacked config in the JSON form IoTflow Forge uses:
+    # hex address strings, "0b........" measurement ranges and string
+    # channel/interface type codes ("2", "01").
+    out = format_addrs(cfg)
+    channels = []
+    for ch in cfg["channels"]:
+        ch = dict(ch)
+        mr = ch.get("measurement_range")
+        if isinstance(mr, int):
+            ch["measurement_range"] = _BIN8[mr & 0xFF]
+        if isinstance(ch.get("channel_type"), int):
+            ch["channel_type"] = str(ch["channel_type"])
+        if isinstance(ch.get("interface_type"), int):
+            ch["interface_type"] = "{:02d}".format(ch["interface_type"])
+        channels.append(ch)
+    out["channels"] = channels
+    return out
+
+
+def _gain_fixed(gain: float):
+    # The gain as a u16 x10000 fixed-point value, or None to keep it as f32.
+    # Rounding moves it by at most 0.00005, which for 0.1 <= gain <= 6.5535
+    # is at most 0.05% (0.008% for the stock 0.2376190...), inside the
+    # ADS1115's own 0.15% max gain error. Gains outside that range keep f32.
+    q = round(gain * _GAIN_SCALE)
+    if _GAIN_FIXED_MIN <= q <= 0xFFFF:
+        return q
+    return None
+
+
+def _channel_flags(ch: dict) -> int:
+    ch_fields_mask = 0
+    if "measurement_range" in ch: ch_fields_mask |= 0x01
+    if "adc_hardware_gain" in ch: ch_fields_mask |= 0x02
+    if "shunt_resistance" in ch: ch_fields_mask |= 0x04
+    if "adc_offset" in ch: ch_fields_mask |= 0x08
+    # sampled-mode channel fields
+    if ch.get("fgnd_gpio") is not None: ch_fields_mask |= 0x10
+    if ch.get("out_gpio") is not None: ch_fields_mask |= 0x20
+    return ch_fields_mask
+
+
+def unpack_string(buf, offset: int):
+    # buf may be bytes or a memoryview; str() decodes either without
+    # first copying the slice into a new bytes object
     length = buf[offset]
-    s = buf[offset+1:offset+1+length].decode("utf-8")
+    s = str(buf[offset+1:offset+1+length], "utf-8")
     return s, offset+1+length
 
 # ----------------------------
@@ -58,110 +263,181 @@ def unpack_string(buf: bytes, offset: int):
 # ----------------------------
 
 def pack_config(cfg: dict) -> bytes:
-    out = bytearray()
+    channels = cfg["channels"]
+    network = cfg["network"]
+    mqtt = cfg["mqtt"]
+    hw = cfg["hardware"]
+    adc_addrs = hw.get("adc_i2c_addrs", [])
 
-    # module & mezzanine
-    out += pack_string(cfg["module_type"])
-    out += pack_string(cfg["mezzanine_type"])
+    # Upper bound of the packed size so the record is written into one
+    # preallocated buffer instead of growing a bytearray field by field
+    size = (_TAG_SIZE + _string_bound(cfg["module_type"]) + _string_bound(cfg["mezzanine_type"])
+            + 1 + _CH_MAX_SIZE * len(channels)
+            + _string_bound(network["wifi_ssid"]) + _string_bound(network["wifi_password"])
+            + _string_bound(mqtt["broker"]) + 2
+            + _string_bound(mqtt["client_id"]) + _string_bound(mqtt["base_topic"])
+            + _string_bound(hw["mode"]) + _HW_FIXED_SIZE
+            + 1 + len(adc_addrs) + 2 + 2)
+    for ch in channels:
+        size += _string_bound(ch["name"])
+    out = bytearray(size)
+    mv = memoryview(out)
+
+    # module & mezzanine, after the version/CRC header filled in at the end
+    off = _write_string(mv, _TAG_SIZE, cfg["module_type"])
+    off = _write_string(mv, off, cfg["mezzanine_type"])
 
     # channels
-    channels = cfg["channels"]
-    out += struct.pack("B", len(channels))
+    out[off] = len(channels); off += 1
     for ch in channels:
-        out += pack_string(ch["name"])
-        out += struct.pack(
-            "BBBB",
-            int(ch["channel_type"]),
-            int(ch["interface_type"]),
+        off = _write_string(mv, off, ch["name"])
+
+        # Channel fields presence flag
+        ch_fields_mask = _channel_flags(ch)
+
+        # Gain in 2-byte fixed point when in range (_GAIN_FIXED)
+        if ch_fields_mask & 0x02:
+            gain = float(ch["adc_hardware_gain"])
+            gain_fixed = _gain_fixed(gain)
+            if gain_fixed is not None:
+                gain = gain_fixed
+                ch_fields_mask |= _GAIN_FIXED
+
+        # Channel header + fields mask in one record
+        struct.pack_into(
+            _CH_HDR, out, off,
+            _as_int(ch["channel_type"]),
+            _as_int(ch["interface_type"]),
             ch["channel_number"],
-            ch["actions"]
+            ch["actions"],
+            ch_fields_mask
         )
-        
-        # Channel fields presence flag
-        ch_fields_mask = 0
-        if "measurement_range" in ch: ch_fields_mask |= 0x01
-        if "adc_hardware_gain" in ch: ch_fields_mask |= 0x02
-        if "shunt_resistance" in ch: ch_fields_mask |= 0x04
-        if "adc_offset" in ch: ch_fields_mask |= 0x08
-        # sampled-mode channel fields
-        if ch.get("fgnd_gpio") is not None: ch_fields_mask |= 0x10
-        if ch.get("out_gpio") is not None: ch_fields_mask |= 0x20
-        out += struct.pack("B", ch_fields_mask)
+        off += _CH_HDR_SIZE
 
         # Pack channel fields
         if ch_fields_mask & 0x01:
-            out += struct.pack("B", int(ch["measurement_range"], 2))
-        if ch_fields_mask & 0x02:
-            # 4-byte float
-            out += struct.pack(">f", float(ch["adc_hardware_gain"]))
-        if ch_fields_mask & 0x04:
-            # 2-byte fixed point
-            shunt = int(ch["shunt_resistance"] * 1000)
-            out += struct.pack(">H", shunt)
-        if ch_fields_mask & 0x08:
-            # 2-byte fixed point
-            offset_val = int(ch["adc_offset"] * 1000)
-            out += struct.pack(">H", offset_val)
+            out[off] = _as_int(ch["measurement_range"], 2); off += 1
+        if (ch_fields_mask & _ADC_CAL_FLAGS) == _ADC_CAL_FLAGS:
+            # Common analog case: gain (4-byte float or 2-byte fixed
+            # point), shunt and offset (2-byte fixed point) as one record
+            if ch_fields_mask & _GAIN_FIXED:
+                fmt, rec_size = _ADC_HHH, _ADC_HHH_SIZE
+            else:
+                fmt, rec_size = _ADC_FHH, _ADC_FHH_SIZE
+            struct.pack_into(
+                fmt, out, off,
+                gain,
+                int(ch["shunt_resistance"] * 1000),
+                int(ch["adc_offset"] * 1000)
+            )
+            off += rec_size
+        else:
+            if ch_fields_mask & _GAIN_FIXED:
+                # 2-byte fixed point
+                struct.pack_into(_U16, out, off, gain); off += 2
+            elif ch_fields_mask & 0x02:
+                # 4-byte float
+                struct.pack_into(_F32, out, off, gain); off += 4
+            if ch_fields_mask & 0x04:
+                # 2-byte fixed point
+                shunt = int(ch["shunt_resistance"] * 1000)
+                struct.pack_into(_U16, out, off, shunt); off += 2
+            if ch_fields_mask & 0x08:
+                # 2-byte fixed point
+                offset_val = int(ch["adc_offset"] * 1000)
+                struct.pack_into(_U16, out, off, offset_val); off += 2
         #   0x10 fgnd_gpio  -> ISO1211 sampled-mode DI
         #   0x20 out_gpio   -> ISO1211 sampled-mode DI
         if ch_fields_mask & 0x10:
-            out += struct.pack("B", int(ch["fgnd_gpio"]) & 0xFF)
+            out[off] = int(ch["fgnd_gpio"]) & 0xFF; off += 1
         if ch_fields_mask & 0x20:
-            out += struct.pack("B", int(ch["out_gpio"]) & 0xFF)
-
+            out[off] = int(ch["out_gpio"]) & 0xFF; off += 1
 
     # network
-    out += pack_string(cfg["network"]["wifi_ssid"])
-    out += pack_string(cfg["network"]["wifi_password"])
+    off = _write_string(mv, off, network["wifi_ssid"])
+    off = _write_string(mv, off, network["wifi_password"])
 
     # mqtt
-    mqtt = cfg["mqtt"]
-    out += pack_string(mqtt["broker"])
-    out += struct.pack(">H", mqtt["port"])
-    out += pack_string(mqtt["client_id"])
-    out += pack_string(mqtt["base_topic"])
+    off = _write_string(mv, off, mqtt["broker"])
+    struct.pack_into(_U16, out, off, mqtt["port"]); off += 2
+    off = _write_string(mv, off, mqtt["client_id"])
+    off = _write_string(mv, off, mqtt["base_topic"])
 
     # hardware
-    hw = cfg["hardware"]
-    out += pack_string(hw["mode"])
-
-    # Pack bus id, SDA/SCL, device addr and EEPROM addr
-    out += struct.pack(
-        "BBBBB",
+    off = _write_string(mv, off, hw["mode"])
+
+    # GPIO pins (4 bits each if pins <= 15): all 8 nibbles in one big-endian
+    # word, pin 1 in the top nibble - the same bytes as packing 2 per byte
+    g = hw["gpio_host_pins"]
+    if "1" in g:
+        # IoTflow Forge JSON object keys are strings
+        g = {int(k): v for k, v in g.items()}
+    gpio_word = ((_pack_nibbles(g[1], g[2], g[3], g[4]) << 16)
+                 | _pack_nibbles(g[5], g[6], g[7], g[8]))
+
+    # Bus id, SDA/SCL, device addr, EEPROM addr, eeprom_size (2-byte unsigned,
+    # big-endian, to support sizes >255) and the GPIO word in one record
+    struct.pack_into(
+        _HW_FIXED, out, off,
         hw["i2c_bus_id"],
         hw["i2c_sda_pin"],
         hw["i2c_scl_pin"],
-        int(hw["i2c_device_addr"], 16),
-        int(hw["eeprom_i2c_addr"], 16)
+        _as_int(hw["i2c_device_addr"], 16),
+        _as_int(hw["eeprom_i2c_addr"], 16),
+        int(hw.get("eeprom_size", 0)),
+        gpio_word
     )
-    # Pack eeprom_size as 2-byte unsigned (big-endian) to support sizes >255
-    out += struct.pack(">H", int(hw.get("eeprom_size", 0)))
-
-    # GPIO pins (pack 2 per byte, 4 bits each if pins <= 15)
-    for i in range(0, 8, 2):
-        packed = ((hw["gpio_host_pins"][str(i+1)] & 0x0F) << 4) | (hw["gpio_host_pins"][str(i+2)] & 0x0F)
-        out += struct.pack("B", packed)
+    off += _HW_FIXED_SIZE
 
     # ADC addresses
-    adc_addrs = hw.get("adc_i2c_addrs", [])
-    out += struct.pack("B", len(adc_addrs))
+    out[off] = len(adc_addrs); off += 1
     for addr in adc_addrs:
-        out += struct.pack("B", int(addr, 16))
+        out[off] = _as_int(addr, 16); off += 1
 
     # ADC sampling rate (Hz) as 2-byte unsigned (big-endian). Optional.
-    out += struct.pack(">H", int(hw.get("adc_sampling_rate", 0)))
+    struct.pack_into(_U16, out, off, int(hw.get("adc_sampling_rate", 0))); off += 2
 
     # pin config + status interval (1 byte interval)
-    out += struct.pack("BB", int(cfg["pin_config"], 2), min(cfg["status_update_interval_s"], 255))
+    struct.pack_into(_PINCFG, out, off, _as_int(cfg["pin_config"], 2), min(cfg["status_update_interval_s"], 255))
+    off += 2
+
+    # version + CRC of the body, in the space reserved at the front
+    struct.pack_into(_TAG, out, 0, _CONFIG_VERSION, _crc16(mv[_TAG_SIZE:off]))
 
-    return bytes(out)
+    return bytes(mv[:off])
 
 # ----------------------------
 # Deserializer (optimized)
 # ----------------------------
 
-def unpack_config(buf: bytes) -> dict:
+def has_version_tag(buf) -> bool:
+    # True if buf starts with the version/CRC header (pack_config output),
+    # False for an image written before the header existed
+    return len(buf) >= _TAG_SIZE and buf[0] == _CONFIG_VERSION
+
+
+# Last image parsed by unpack_config (a bytes copy) and its result
+_last_image = None
+_last_cfg = None
+
+
+def unpack_config(buf) -> dict:
+    # buf: bytes, bytearray or memoryview. Viewed as a memoryview so string
+    # and address slices do not copy. A tagged image whose CRC does not
+    # match raises ValueError. An image byte-for-byte equal to the previous
+    # call's returns the same dict again (one memcmp, no CRC or parse), so
+    # callers must not modify it.
+    global _last_image, _last_cfg
+    # Keep the bytes on the left: bytes == memoryview compares contents
+    if _last_image is not None and _last_image == buf:
+        return _last_cfg
+    buf = memoryview(buf)
     offset = 0
+    if has_version_tag(buf):
+        crc = struct.unpack_from(_U16, buf, 1)[0]
+        if _crc16(buf[_TAG_SIZE:]) != crc:
+            raise ValueError("config CRC mismatch")
+        offset = _TAG_SIZE
     cfg = {}
 
     # module + mezzanine
@@ -173,33 +449,48 @@ def unpack_config(buf: bytes) -> dict:
     cfg["channels"] = []
     for _ in range(num_channels):
         name, offset = unpack_string(buf, offset)
-        ch_type, if_type, ch_num, actions = struct.unpack_from("BBBB", buf, offset)
-        offset += 4
+        ch_type, if_type, ch_num, actions, ch_fields_mask = struct.unpack_from(_CH_HDR, buf, offset)
+        offset += _CH_HDR_SIZE
 
         ch = {
             "name": name,
-            "channel_type": str(ch_type),
-            "interface_type": str(if_type),
+            "channel_type": ch_type,
+            "interface_type": if_type,
             "channel_number": ch_num,
             "actions": actions
         }
 
-        ch_fields_mask = buf[offset]; offset += 1
         if ch_fields_mask & 0x01:
-            ch["measurement_range"] = "0b" + "{:08b}".format(buf[offset])
+            ch["measurement_range"] = buf[offset]
             offset += 1
-        if ch_fields_mask & 0x02:
-            gain = struct.unpack_from(">f", buf, offset)[0]
+        if (ch_fields_mask & _ADC_CAL_FLAGS) == _ADC_CAL_FLAGS:
+            if ch_fields_mask & _GAIN_FIXED:
+                gain, shunt, offset_val = struct.unpack_from(_ADC_HHH, buf, offset)
+                gain /= _GAIN_SCALE
+                offset += _ADC_HHH_SIZE
+            else:
+                gain, shunt, offset_val = struct.unpack_from(_ADC_FHH, buf, offset)
+                offset += _ADC_FHH_SIZE
             ch["adc_hardware_gain"] = gain
-            offset += 4
-        if ch_fields_mask & 0x04:
-            shunt = struct.unpack_from(">H", buf, offset)[0] / 1000.0
-            ch["shunt_resistance"] = shunt
-            offset += 2
-        if ch_fields_mask & 0x08:
-            offset_val = struct.unpack_from(">H", buf, offset)[0] / 1000.0
-            ch["adc_offset"] = offset_val
-            offset += 2
+            ch["shunt_resistance"] = shunt / 1000.0
+            ch["adc_offset"] = offset_val / 1000.0
+        else:
+            if ch_fields_mask & _GAIN_FIXED:
+                gain = struct.unpack_from(_U16, buf, offset)[0] / _GAIN_SCALE
+                ch["adc_hardware_gain"] = gain
+                offset += 2
+            elif ch_fields_mask & 0x02:
+                gain = struct.unpack_from(_F32, buf, offset)[0]
+                ch["adc_hardware_gain"] = gain
+                offset += 4
+            if ch_fields_mask & 0x04:
+                shunt = struct.unpack_from(_U16, buf, offset)[0] / 1000.0
+                ch["shunt_resistance"] = shunt
+                offset += 2
+            if ch_fields_mask & 0x08:
+                offset_val = struct.unpack_from(_U16, buf, offset)[0] / 1000.0
+                ch["adc_offset"] = offset_val
+                offset += 2
         #   0x10 fgnd_gpio  -> ISO1211 sampled-mode DI
         #   0x20 out_gpio   -> ISO1211 sampled-mode DI
         if ch_fields_mask & 0x10:
@@ -218,7 +509,7 @@ def unpack_config(buf: bytes) -> dict:
 
     # mqtt
     broker, offset = unpack_string(buf, offset)
-    port = struct.unpack_from(">H", buf, offset)[0]; offset += 2
+    port = struct.unpack_from(_U16, buf, offset)[0]; offset += 2
     client_id, offset = unpack_string(buf, offset)
     base_topic, offset = unpack_string(buf, offset)
     cfg["mqtt"] = {
@@ -230,35 +521,29 @@ def unpack_config(buf: bytes) -> dict:
 
     # hardware
     mode, offset = unpack_string(buf, offset)
-    bus_id, sda, scl, dev_addr, eeprom_addr = struct.unpack_from("BBBBB", buf, offset)
-    offset += 5
-    # eeprom_size stored as 2-byte unsigned big-endian
-    eeprom_size = struct.unpack_from(">H", buf, offset)[0]; offset += 2
+    # eeprom_size stored as 2-byte unsigned big-endian, GPIO pins as 8 nibbles
+    (bus_id, sda, scl, dev_addr, eeprom_addr, eeprom_size,
+     gpio_word) = struct.unpack_from(_HW_FIXED, buf, offset)
+    offset += _HW_FIXED_SIZE
 
-    # GPIO unpack (2 per byte)
     gpio = {}
-    for i in range(0, 8, 2):
-        packed = buf[offset]; offset += 1
-        gpio[str(i+1)] = (packed >> 4) & 0x0F
-        gpio[str(i+2)] = packed & 0x0F
+    for i in range(1, 9):
+        gpio[i] = (gpio_word >> (32 - 4 * i)) & 0x0F
 
-    # ADC addresses
+    # ADC addresses (ints)
     num_adcs = buf[offset]; offset += 1
-    adc_addrs = []
-    for _ in range(num_adcs):
-        addr = buf[offset]; offset += 1
-        adc_addrs.append(hex(addr))
-        
+    adc_addrs = list(buf[offset:offset+num_adcs]); offset += num_adcs
+
     # ADC sampling rate (2 bytes)
-    adc_sampling_rate = struct.unpack_from(">H", buf, offset)[0]; offset += 2
+    adc_sampling_rate = struct.unpack_from(_U16, buf, offset)[0]; offset += 2
 
     cfg["hardware"] = {
         "mode": mode,
         "i2c_bus_id": bus_id,
         "i2c_sda_pin": sda,
         "i2c_scl_pin": scl,
-        "i2c_device_addr": hex(dev_addr),
-        "eeprom_i2c_addr": hex(eeprom_addr),
+        "i2c_device_addr": dev_addr,
+        "eeprom_i2c_addr": eeprom_addr,
         "eeprom_size": eeprom_size,
         "gpio_host_pins": gpio,
         "adc_i2c_addrs": adc_addrs,
@@ -267,8 +552,65 @@ def unpack_config(buf: bytes) -> dict:
     }
 
     # pin config + status interval
-    pin_cfg, status_int = struct.unpack_from("BB", buf, offset); offset += 2
-    cfg["pin_config"] = "0b" + "{:08b}".format(pin_cfg)
+    pin_cfg, status_int = struct.unpack_from(_PINCFG, buf, offset); offset += 2
+    cfg["pin_config"] = _BIN8[pin_cfg]
     cfg["status_update_interval_s"] = status_int
 
+    _last_image, _last_cfg = bytes(buf), cfg
     return cfg
+
+
+# ----------------------------
+# EEPROM storage
+# ----------------------------
+
+# Last config image (2-byte length header + packed config) known to be in
+# EEPROM, and its start address. Assumes nothing else rewrites that region.
+_eeprom_shadow = None
+_eeprom_shadow_addr = None
+
+
+def remember_image(addr0: int, image) -> None:
+    # Record the config image read from EEPROM at boot so the first
+    # save_config only rewrites the pages that change
+    global _eeprom_shadow, _eeprom_shadow_addr
+    _eeprom_shadow = bytearray(image)
+    _eeprom_shadow_addr = addr0
+
+
+def save_config(cfg: dict, eeprom, addr0: int = 0, max_size: int = None):
+    # Pack cfg and store it at addr0 behind a 2-byte big-endian length.
+    # Only EEPROM pages that differ from the shadow image are written.
+    # Returns the packed config, or None if it is larger than max_size.
+    global _eeprom_shadow, _eeprom_shadow_addr, _last_image
+    packed = pack_config(cfg)
+    if max_size is not None and len(packed) > max_size:
+        return None
+    # The EEPROM contents change: drop the memoized unpack_config result
+    _last_image = None
+    image = struct.pack(_U16, len(packed)) + packed
+
+    shadow = _eeprom_shadow
+    # Until every write below completes, the EEPROM may hold a mix of the
+    # old and new images, so no shadow is trusted (the next save then
+    # compares against the EEPROM itself)
+    _eeprom_shadow = None
+    if shadow is None or _eeprom_shadow_addr != addr0:
+        # No known image: let the driver compare against the EEPROM itself
+        eeprom.write_bytes(addr0, image)
+    else:
+        page_size = eeprom.PAGE_SIZE
+        size = len(image)
+        known = len(shadow)
+        mv = memoryview(image)
+        start = 0
+        while start < size:
+            # Chunks end on physical page boundaries
+            end = min(size, (addr0 + start) // page_size * page_size + page_size - addr0)
+            if end > known or shadow[start:end] != image[start:end]:
+                eeprom.write_bytes(addr0 + start, mv[start:end], update=False)
+            start = end
+
+    _eeprom_shadow = bytearray(image)
+    _eeprom_shadow_addr = addr0
+    return packed
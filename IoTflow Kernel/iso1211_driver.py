@@ -44,13 +44,13 @@ without any changes. This module never touches them.
 
 Channel configuration (read from the same EEPROM source as all other channels)
 ------------------------------------------------------------------------------
-A sampled-mode ISO1211 channel is identified by ``channel_type == "3"`` and
+A sampled-mode ISO1211 channel is identified by ``channel_type == 3`` and
 carries the following fields:
 
     name             : human-readable label (<= 8 chars, like other channels)
-    channel_type     : "3"  -> ISO1211 sampled-mode DI
-    interface_type   : "01" -> OUT read via a direct MCU GPIO pin   (out_source = "gpio")
-                       "11" -> OUT read via the TCA9534 I2C expander (out_source = "i2c")
+    channel_type     : 3    -> ISO1211 sampled-mode DI
+    interface_type   : 1    -> OUT read via a direct MCU GPIO pin   (out_source = "gpio")
+                       11   -> OUT read via the TCA9534 I2C expander (out_source = "i2c")
                        (identical meaning/codes to standard DI channels)
     channel_number   : 0-7  -> position used for the OUT read (TCA9534 bit, or
                               HOST pin lookup), and for the MQTT topic
@@ -59,7 +59,7 @@ carries the following fields:
                               *** The only parameter unique to sampled mode. ***
                               REQUIRED. A channel with a missing/invalid
                               fgnd_gpio is rejected (logged) and skipped.
-    out_gpio         : int  -> OPTIONAL. Only meaningful when interface_type == "01".
+    out_gpio         : int  -> OPTIONAL. Only meaningful when interface_type == 1.
                               Explicit MCU pin for the ISO1211 OUT signal. If
                               omitted, the OUT pin is looked up from
                               gpio_host_pins[channel_number + 1] (same HOST-pin
@@ -111,11 +111,12 @@ OUT_ACTIVE_LOW = True
 # shared channel configuration (analogous to "1" = digital bit, "2" = analog).
 ISO1211_CHANNEL_TYPE = 3
 
-# interface_type codes (shared with standard DI channels) -> out_source
+# interface_type codes (shared with standard DI channels) -> out_source.
+# Keys are the integer codes; "01"/"11"/"12" strings from JSON map via int().
 _OUT_SOURCE_BY_INTERFACE = {
-    "01": "gpio",
-    "11": "i2c",
-    "12": "i2c",  # GPIO + I2C: OUT is read over the expander
+    1: "gpio",
+    11: "i2c",
+    12: "i2c",  # GPIO + I2C: OUT is read over the expander
 }
 
 # Internal scan-state-machine states
@@ -261,7 +262,10 @@ class Iso1211Driver:
         """Build the OUT-reader state for each validated channel."""
         for ch, fgnd_pin in valid_specs:
             ch_num = ch.get("channel_number")
-            interface_type = str(ch.get("interface_type", "01"))
+            try:
+                interface_type = int(ch.get("interface_type", 1))
+            except (TypeError, ValueError):
+                interface_type = 1
             out_source = _OUT_SOURCE_BY_INTERFACE.get(interface_type, "gpio")
 
             out_pin = None
@@ -439,11 +443,14 @@ class Iso1211Driver:
         print("\n=== ISO1211 Sampled-Mode Channel Configuration ===")
         print("t_settle = {} ms".format(self.t_settle_ms))
         for ch in self.channels:
-            print("Channel {}: {}".format(ch["channel_number"], ch["name"]))
-            print("  OUT source: {}".format(ch["out_source"]))
+            lines = [
+                "Channel {}: {}".format(ch["channel_number"], ch["name"]),
+                "  OUT source: {}".format(ch["out_source"]),
+            ]
             if ch["out_source"] == "i2c":
-                print("  OUT bit: {} (TCA9534 0x{:02X})"
-                      .format(ch["out_bit"], self.device_address))
-            print("  Last value: {}  Error: {}"
-                  .format(ch["last_value"], ch["error"]))
+                lines.append("  OUT bit: {} (TCA9534 0x{:02X})"
+                             .format(ch["out_bit"], self.device_address))
+            lines.append("  Last value: {}  Error: {}"
+                         .format(ch["last_value"], ch["error"]))
+            print("\n".join(lines))
         print()
@@ -50,7 +50,7 @@ import config
 from iot_driver import IotDriver
 from mqtt_manager import MqttManager
 from EEPROM_driver import EEPROM
-from config_serializer import pack_config, unpack_config
+from config_serializer import unpack_config, format_config, save_config, remember_image, has_version_tag
 from analog_driver import AnalogDriver
 from iso1211_driver import Iso1211Driver
 
@@ -95,7 +95,7 @@ config_dict = {
     'GPIO_HOST_PINS': config.GPIO_HOST_PINS,
     'PIN_CONFIG': config.PIN_CONFIG,
     'STATUS_UPDATE_INTERVAL_S': config.STATUS_UPDATE_INTERVAL_S,
-    'ADC_I2C_ADDRS': [hex(addr) for addr in config.ADC_I2C_ADDRS],
+    'ADC_I2C_ADDRS': list(config.ADC_I2C_ADDRS),
     'ADC_SAMPLING_RATE': config.ADC_SAMPLING_RATE,
     'channels': config.CHANNELS,
 }
@@ -131,7 +131,7 @@ def _octal3_channels_from_pin_config(pin_config):
 
 
 def _host_pin_lookup(host_pins, position):
-    """Look up a host-pin GPIO by int or str key (Forge/EEPROM use string keys)."""
+    """Look up a host-pin GPIO by int or str key (Forge JSON uses string keys)."""
     if position in host_pins:
         return host_pins[position]
     return host_pins.get(str(position))
@@ -241,7 +241,7 @@ def update_config(new_config):
             'I2C_BUS_ID': new_config['hardware']['i2c_bus_id'],
             'I2C_SDA_PIN': new_config['hardware']['i2c_sda_pin'],
             'I2C_SCL_PIN': new_config['hardware']['i2c_scl_pin'],
-            'I2C_DEVICE_ADDR': int(new_config['hardware']['i2c_device_addr'], 16),
+            'I2C_DEVICE_ADDR': new_config['hardware']['i2c_device_addr'],
             'GPIO_HOST_PINS': new_config['hardware']['gpio_host_pins'],
             'PIN_CONFIG': int(new_config['pin_config'], 2),
             'STATUS_UPDATE_INTERVAL_S': new_config['status_update_interval_s'],
@@ -276,7 +276,7 @@ def update_config(new_config):
         }
         
         # Reinitialize AnalogDriver
-        analog_driver = AnalogDriver(i2c, analog_config)
+        analog_driver = AnalogDriver(i2c, analog_config, verbose=DEBUG)
 
         # Reinitialize ISO1211 sampled-mode DI driver.
         # SAFETY: constructing this de-asserts every fgnd_gpio (TLP188 OFF) first.
@@ -366,20 +366,8 @@ def check_and_publish_analog():
                     channel_configs = analog_driver.channel_configs
                     if channel in channel_configs:
                         ch_config = channel_configs[channel]
-                        # Try to get measurement_range, fallback to type if missing
-                        if 'measurement_range' in ch_config:
-                            range_code = int(ch_config['measurement_range'], 2)
-                            config = analog_driver.range_configs.get(range_code)
-                        else:
-                            config = None
-                        
-                        # Determine unit based on type or config
-                        if config and config['type'] == 'voltage':
-                            unit = "V"
-                        elif ch_config.get('type') == 'voltage':
-                            unit = "V"
-                        else:
-                            unit = "mA"
+                        # Determine unit from the parsed measurement type
+                        unit = "V" if ch_config.get('type') == 'voltage' else "mA"
                         
                         value_str = f"{value:.3f}"
                         if DEBUG:
@@ -405,20 +393,8 @@ def check_and_publish_analog():
 #                     channel_configs = analog_driver.channel_configs
 #                     if channel in channel_configs:
 #                         ch_config = channel_configs[channel]
-#                         # Try to get measurement_range, fallback to type if missing
-#                         if 'measurement_range' in ch_config:
-#                             range_code = int(ch_config['measurement_range'], 2)
-#                             config = analog_driver.range_configs.get(range_code)
-#                         else:
-#                             config = None
-#                         
-#                         # Determine unit based on type or config
-#                         if config and config['type'] == 'voltage':
-#                             unit = "V"
-#                         elif ch_config.get('type') == 'voltage':
-#                             unit = "V"
-#                         else:
-#                             unit = "mA"
+#                         # Determine unit from the parsed measurement type
+#                         unit = "V" if ch_config.get('type') == 'voltage' else "mA"
 #                         
 #                         # Check if value has changed from last published value
 #                         last_value = last_analog_values.get(channel)
@@ -476,8 +452,24 @@ def read_eeprom_config():
             if DEBUG:
                 print("Error: Invalid data length in EEPROM")
             return None
-        raw = eeprom.read_bytes(0x002, length)
-        restored = unpack_config(raw)
+        # Read the packed config straight into one buffer (a combined
+        # transaction per 256-byte block) and unpack it without copies.
+        # A corrupted image fails its CRC check and raises here.
+        raw = bytearray(length)
+        eeprom.read_into(0x002, raw)
+        restored = unpack_config(memoryview(raw))
+        remember_image(0x000, length_bytes + raw)
+        if not has_version_tag(raw):
+            # Written before the version/CRC header: store it in the current
+            # format so later reads are CRC-checked
+            try:
+                save_config(restored, eeprom, 0x000, EEPROM_CONFIG_MAX_PACKED)
+                if DEBUG:
+                    print("Migrated EEPROM config to the versioned format")
+            except Exception as e:
+                # Best effort: keep the config just read and try again next boot
+                if DEBUG:
+                    print("EEPROM config migration failed:", e)
         #print("Restored config from EEPROM:", ujson.dumps(restored))
         return restored
     except Exception as e:
@@ -535,7 +527,7 @@ def main():
         }
         
         # Initialize AnalogDriver
-        analog_driver = AnalogDriver(i2c, analog_config)
+        analog_driver = AnalogDriver(i2c, analog_config, verbose=DEBUG)
                          
         analog_driver.print_channel_configs()
 
@@ -598,26 +590,23 @@ def main():
                                             print("Received read command")
                                         restored = read_eeprom_config()
                                         if restored:
-                                            send_data_back(restored)
+                                            send_data_back(format_config(restored))
                                         else:
                                             send_data_back({"error": "Failed to read or unpack EEPROM data"})
                                     else:
-                                        packed = pack_config(data)
-                                        if DEBUG:
-                                            print("Packed size:", len(packed), "bytes")
-                                        if len(packed) > EEPROM_CONFIG_MAX_PACKED:
+                                        # Writes only the EEPROM pages that changed
+                                        packed = save_config(data, eeprom, 0x000, EEPROM_CONFIG_MAX_PACKED)
+                                        if packed is None:
                                             print("Error: Packed data too large for EEPROM")
                                             continue
-                                        length_bytes = struct.pack(">H", len(packed))
-                                        eeprom.write_bytes(0x000, length_bytes)
-                                        eeprom.write_bytes(0x002, packed)
                                         if DEBUG:
+                                            print("Packed size:", len(packed), "bytes")
                                             print("Wrote data to EEPROM")
                                         raw = eeprom.read_bytes(0x002, len(packed))
                                         restored = unpack_config(raw)
                                         if DEBUG:
-                                            print("Restored config:", ujson.dumps(restored))
-                                        send_data_back(restored)
+                                            print("Restored config:", ujson.dumps(format_config(restored)))
+                                        send_data_back(format_config(restored))
                                         update_config(restored)
                                         if not config_dict['WIFI_SSID']:
                                             if DEBUG: